@@ -5,30 +5,287 @@ Scrapes historical price data and updates the CSV file with new data.
 Always merges with existing data to maintain complete historical record.
 """
 
-from scraper import EUA2FuturesScraper
-from visualize import EUA2DataVisualizer
+import argparse
+import asyncio
+import atexit
+import hashlib
+import json
+import logging
+import logging.handlers
+import pickle
+import time
+from datetime import date, datetime
 from pathlib import Path
 
+from scraper import EUA2FuturesScraper
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Scrape results are cached on disk so intraday reruns don't re-download
+# the entire history from ICE. Keyed by the current date; entries older
+# than CACHE_TTL_SECONDS are considered stale.
+CACHE_DIR = Path(".scrape_cache")
+CACHE_TTL_SECONDS = 3600
+
+# Status output goes through a memory-buffered handler so a run issues a
+# handful of write() syscalls at flush time instead of one per message.
+log = logging.getLogger("eua2")
+
+
+def _setup_logging():
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter('%(message)s'))
+    buffered = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=stream)
+    log.addHandler(buffered)
+    log.setLevel(logging.INFO)
+    atexit.register(buffered.flush)
+
+
+async def cached_scrape(scraper: EUA2FuturesScraper, force_refresh: bool = False):
+    """
+    Run the scrape, caching the result on disk.
+
+    Returns cached data if a fresh cache entry (same day, within TTL)
+    exists, otherwise scrapes and stores the result for later reruns.
+    """
+    cache_file = CACHE_DIR / f"scrape_{date.today().isoformat()}.pkl"
+
+    if not force_refresh and cache_file.exists():
+        age = time.time() - cache_file.stat().st_mtime
+        if age < CACHE_TTL_SECONDS:
+            try:
+                with open(cache_file, 'rb') as f:
+                    data = pickle.load(f)
+                log.info(f"Using cached scrape results from {cache_file} ({int(age)}s old)")
+                return data
+            except Exception as e:
+                log.info(f"⚠ Warning: Could not read scrape cache: {e}")
+
+    # Try the concurrent API fetch first; fall back to the full Playwright
+    # scrape if the direct endpoint yields nothing.
+    data = []
+    try:
+        data = await scraper.scrape_data_async()
+    except Exception as e:
+        log.info(f"⚠ Warning: Concurrent API fetch failed: {e}")
+    if not data:
+        try:
+            data = await scraper.scrape_data(try_multiple_spans=True)
+        finally:
+            # The shared browser must be torn down inside this event loop
+            await scraper.close()
+
+    if data:
+        try:
+            CACHE_DIR.mkdir(exist_ok=True)
+            with open(cache_file, 'wb') as f:
+                pickle.dump(data, f)
+        except Exception as e:
+            log.info(f"⚠ Warning: Could not write scrape cache: {e}")
+
+    return data
+
+
+async def _cleanup_and_scrape(scraper: EUA2FuturesScraper, force_refresh: bool):
+    """
+    Run CSV cleanup and the scrape concurrently.
+
+    Cleanup only touches the existing file on disk and the scrape only
+    talks to the network, so overlapping them makes total latency roughly
+    max(cleanup, scrape) instead of their sum.
+    """
+    cleanup_task = asyncio.to_thread(scraper.cleanup_csv)
+    scrape_task = cached_scrape(scraper, force_refresh=force_refresh)
+    existing_data, data = await asyncio.gather(cleanup_task, scrape_task)
+    return existing_data, data
+
+
+def _csv_last_date(csv_path: Path):
+    """Read the date of the last CSV row without parsing the whole file"""
+    try:
+        size = csv_path.stat().st_size
+        with open(csv_path, 'rb') as f:
+            f.seek(max(size - 256, 0))
+            tail = f.read().decode('utf-8', errors='replace')
+        lines = [line for line in tail.splitlines() if line.strip()]
+        if not lines:
+            return None
+        return datetime.strptime(lines[-1].split(',')[0].strip(), '%Y-%m-%d').date()
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def last_expected_trading_day() -> date:
+    """Return the most recent weekday (ICE publishes no weekend data)"""
+    day = date.today()
+    while day.weekday() >= 5:  # Saturday=5, Sunday=6
+        day = date.fromordinal(day.toordinal() - 1)
+    return day
+
+
+VIZ_HASH_FILE = Path(".viz_hash")
+VIZ_OUTPUT_FILE = "eua2_futures_visualization.png"
+SUMMARY_FILE = Path("summary.json")
+
+
+def _build_summary(rows) -> dict:
+    """Compute full summary stats (count/min/max/sum/date range) from rows"""
+    if np is not None:
+        prices = np.fromiter((d['price'] for d in rows),
+                             dtype=np.float64, count=len(rows))
+        lo, hi, total = float(prices.min()), float(prices.max()), float(prices.sum())
+    else:
+        prices = [d['price'] for d in rows]
+        lo, hi, total = min(prices), max(prices), sum(prices)
+    return {
+        'count': len(rows),
+        'min': lo,
+        'max': hi,
+        'sum': total,
+        'first_date': rows[0]['date'],
+        'last_date': rows[-1]['date'],
+    }
+
+
+def update_summary(final_data, new_rows) -> dict:
+    """
+    Update the running summary sidecar (summary.json) after a save
+
+    When every new row appends past the recorded range, the previous
+    stats are folded forward in O(new rows). Falls back to a full
+    rebuild whenever the sidecar is missing, its count no longer lines
+    up with the CSV (e.g. after a cleanup rewrote rows), or the scrape
+    overlapped dates already covered - the merge prefers new over old,
+    so an overlapping row may have revised an existing price in place.
+    """
+    stats = None
+    try:
+        with open(SUMMARY_FILE, 'r', encoding='utf-8') as f:
+            stats = json.load(f)
+    except Exception:
+        stats = None
+
+    if stats:
+        appended = [r for r in new_rows if r['date'] > stats['last_date']]
+        if len(appended) != len(new_rows):
+            # Some scraped rows fall inside the recorded range; keep='last'
+            # merging may have replaced their prices, which the count check
+            # below cannot see. The rebuild is cheap - correctness wins.
+            stats = None
+        elif stats['count'] + len(appended) == len(final_data):
+            for row in appended:
+                price = row['price']
+                stats['count'] += 1
+                stats['sum'] += price
+                stats['min'] = min(stats['min'], price)
+                stats['max'] = max(stats['max'], price)
+                if row['date'] > stats['last_date']:
+                    stats['last_date'] = row['date']
+        else:
+            stats = None  # Sidecar drifted from the file - rebuild
+
+    if stats is None:
+        stats = _build_summary(final_data)
+
+    try:
+        SUMMARY_FILE.write_text(json.dumps(stats))
+    except Exception as e:
+        log.info(f"⚠ Warning: Could not write summary sidecar: {e}")
+
+    return stats
+
+
+def _csv_hash(csv_file: str) -> str:
+    """Hash the CSV contents to detect whether the data changed"""
+    with open(csv_file, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def update_visualization(csv_file: str, data=None):
+    """
+    Regenerate the visualization from the CSV, warning on failure
+
+    Pass data (list of date/price dicts) to reuse rows that are already
+    in memory instead of re-parsing the CSV.
+
+    Skips the (expensive) matplotlib render entirely when the CSV is
+    unchanged since the last run and the PNG still exists.
+    """
+    current_hash = None
+    try:
+        current_hash = _csv_hash(csv_file)
+        if (VIZ_HASH_FILE.exists() and Path(VIZ_OUTPUT_FILE).exists()
+                and VIZ_HASH_FILE.read_text().strip() == current_hash):
+            log.info("✓ Visualization already up to date (data unchanged)")
+            return
+    except Exception:
+        pass  # Hash staleness must never block a regen
+
+    try:
+        # Imported lazily so data-only runs (cron refreshes, --no-viz)
+        # don't pay the matplotlib import cost at startup
+        from visualize import EUA2DataVisualizer
+
+        visualizer = EUA2DataVisualizer(csv_file=csv_file, data=data)
+        visualizer.load_data()
+        visualizer.create_visualization(show_plot=False)
+        log.info("✓ Visualization updated successfully")
+        if current_hash:
+            try:
+                VIZ_HASH_FILE.write_text(current_hash)
+            except Exception:
+                pass
+    except Exception as e:
+        log.info(f"⚠ Warning: Could not update visualization: {e}")
+
+
 def main():
+    _setup_logging()
+
+    parser = argparse.ArgumentParser(description='Scrape EUA 2 Futures data and update the CSV')
+    parser.add_argument('--force-refresh', action='store_true',
+                       help='Ignore cached scrape results and re-download from ICE')
+    parser.add_argument('--no-viz', action='store_true',
+                       help='Skip the visualization update (data refresh only)')
+    args = parser.parse_args()
+
     # Create scraper instance
     csv_file = "eua2_futures_data.csv"
     scraper = EUA2FuturesScraper(output_file=csv_file)
     
-    # Check if CSV already exists and clean it up
     csv_path = Path(csv_file)
+
+    # Short-circuit: if the CSV already covers the most recent trading day,
+    # there is nothing new to scrape - jump straight to the visualization.
+    # A cheap tail probe avoids parsing the whole file just to decide this.
+    if csv_path.exists() and not args.force_refresh:
+        last_date = _csv_last_date(csv_path)
+        if last_date and last_date >= last_expected_trading_day():
+            log.info(f"✓ CSV already current (last record: {last_date}), skipping scrape")
+            if not args.no_viz:
+                log.info("\nUpdating visualization with existing data...")
+                update_visualization(csv_file)
+            return
+
+    # Overlap the CSV cleanup (disk-bound) with the scrape (network-bound)
+    existing_data = []
     existing_count = 0
+    log.info("Scraping new data from ICE website...")
     if csv_path.exists():
-        print("Cleaning up existing CSV file...")
-        existing_count = scraper.cleanup_csv()
+        log.info("Cleaning up existing CSV file in parallel...")
+        existing_data, data = asyncio.run(
+            _cleanup_and_scrape(scraper, args.force_refresh))
+        existing_count = len(existing_data)
         if existing_count > 0:
-            existing_data = scraper.load_existing_csv()
-            print(f"Found existing CSV with {existing_count} clean data points")
-            print(f"  Date range: {existing_data[0]['date']} to {existing_data[-1]['date']}")
-    
-    # Scrape data (tries multiple time spans for maximum historical data)
-    print("\nScraping new data from ICE website...")
-    data = scraper.scrape_data(try_multiple_spans=True)
-    
+            log.info(f"Found existing CSV with {existing_count} clean data points")
+            log.info(f"  Date range: {existing_data[0]['date']} to {existing_data[-1]['date']}")
+    else:
+        data = asyncio.run(cached_scrape(scraper, force_refresh=args.force_refresh))
+
     if data:
         # Save to CSV, merging with existing data
         output_file = scraper.save_to_csv(data, update_existing=True)
@@ -36,45 +293,37 @@ def main():
         # Load final data to show complete summary
         final_data = scraper.load_existing_csv()
         
-        print(f"\n{'='*60}")
-        print(f"✓ Data update complete!")
-        print(f"{'='*60}")
-        print(f"\nCSV file: {output_file}")
-        print(f"\nSummary:")
-        print(f"  New records scraped: {len(data)}")
-        print(f"  Total records in CSV: {len(final_data)}")
+        log.info(f"\n{'='*60}")
+        log.info(f"✓ Data update complete!")
+        log.info(f"{'='*60}")
+        log.info(f"\nCSV file: {output_file}")
+        log.info(f"\nSummary:")
+        log.info(f"  New records scraped: {len(data)}")
+        log.info(f"  Total records in CSV: {len(final_data)}")
         if final_data:
-            print(f"  Date range: {final_data[0]['date']} to {final_data[-1]['date']}")
-            prices = [d['price'] for d in final_data]
-            print(f"  Price range: €{min(prices):.2f} - €{max(prices):.2f}")
-            print(f"  Average price: €{sum(prices)/len(prices):.2f}")
+            # Summary comes from the incrementally maintained sidecar, so
+            # only the newly appended rows are aggregated here
+            stats = update_summary(final_data, data)
+            log.info(f"  Date range: {stats['first_date']} to {stats['last_date']}")
+            log.info(f"  Price range: €{stats['min']:.2f} - €{stats['max']:.2f}")
+            log.info(f"  Average price: €{stats['sum'] / stats['count']:.2f}")
         
         # Update visualization
-        print(f"\n{'='*60}")
-        print("Updating visualization...")
-        print(f"{'='*60}")
-        try:
-            visualizer = EUA2DataVisualizer(csv_file=csv_file)
-            visualizer.load_data()
-            visualizer.create_visualization(show_plot=False)
-            print("✓ Visualization updated successfully")
-        except Exception as e:
-            print(f"⚠ Warning: Could not update visualization: {e}")
+        if not args.no_viz:
+            log.info(f"\n{'='*60}")
+            log.info("Updating visualization...")
+            log.info(f"{'='*60}")
+            update_visualization(csv_file, data=final_data)
     else:
-        print("\n✗ No new data was extracted.")
+        log.info("\n✗ No new data was extracted.")
         if existing_count > 0:
-            print(f"  Existing CSV file unchanged ({existing_count} records)")
+            log.info(f"  Existing CSV file unchanged ({existing_count} records)")
             # Still try to update visualization with existing data
-            print("\nUpdating visualization with existing data...")
-            try:
-                visualizer = EUA2DataVisualizer(csv_file=csv_file)
-                visualizer.load_data()
-                visualizer.create_visualization(show_plot=False)
-                print("✓ Visualization updated successfully")
-            except Exception as e:
-                print(f"⚠ Warning: Could not update visualization: {e}")
+            if not args.no_viz:
+                log.info("\nUpdating visualization with existing data...")
+                update_visualization(csv_file)
         else:
-            print("  Please check the website or update the scraper.")
+            log.info("  Please check the website or update the scraper.")
 
 if __name__ == "__main__":
     main()
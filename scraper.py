@@ -5,15 +5,115 @@ Scrapes historical price data from ICE website for EUA 2 Futures
 """
 
 import ast
+import asyncio
 import csv
+import hashlib
 import json
+import os
 import re
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Optional
 
-from playwright.sync_api import sync_playwright, Page
+from playwright.async_api import async_playwright, Browser, Page
+
+# Parquet support is optional; when pyarrow is available a typed Parquet
+# mirror of the CSV is maintained so reloads skip Python date re-parsing.
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# pandas is used for vectorized merge/dedupe when available; the pure
+# Python paths remain as fallback.
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# orjson decodes the multi-MB timeseries payloads 2-5x faster than the
+# stdlib json module.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(raw):
+    """Decode JSON from str or bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Patterns and keyword tuples used on hot paths, compiled once at import
+_URL_KEYWORDS = ('api', 'data', 'chart', 'price', 'market', 'historical', 'timeseries')
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_YMD_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+_TOOLTIP_DATE_PATTERNS = (
+    re.compile(r'(\d{4}[-/]\d{2}[-/]\d{2})'),
+    re.compile(r'(\d{2}[-/]\d{2}[-/]\d{4})'),
+)
+_TOOLTIP_PRICE_PATTERNS = (
+    re.compile(r'[\d,]+\.?\d*'),
+    re.compile(r'€\s*([\d,]+\.?\d*)'),
+    re.compile(r'\$\s*([\d,]+\.?\d*)'),
+)
+_SCRIPT_JSON_PATTERNS = tuple(re.compile(p, re.DOTALL) for p in (
+    r'var\s+\w+\s*=\s*(\{.*?\});',
+    r'data:\s*(\[.*?\])',
+    r'prices:\s*(\[.*?\])',
+    r'values:\s*(\[.*?\])',
+))
+
+# strptime candidates bucketed by input length so each row only tries
+# formats that can actually match, instead of the full cascade
+_DATE_FORMATS_BY_LEN = {
+    10: ('%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y'),
+    19: ('%Y-%m-%d %H:%M:%S',),
+    24: ('%a %b %d %H:%M:%S %Y',),  # "Mon Jun 30 00:00:00 2025"
+}
+_DATE_FORMATS_ALL = ('%Y-%m-%d', '%a %b %d %H:%M:%S %Y', '%Y-%m-%d %H:%M:%S',
+                     '%m/%d/%Y', '%d/%m/%Y')
+
+
+def _parse_date_str(date_str: str) -> Optional[datetime]:
+    """Parse a date string, trying only formats whose length can match"""
+    # 'YYYY-MM-DD' is what the scraper itself writes, so it covers nearly
+    # every row on reload - slice it directly instead of paying strptime
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return datetime(int(date_str[:4]), int(date_str[5:7]),
+                            int(date_str[8:10]))
+        except ValueError:
+            pass
+    for fmt in _DATE_FORMATS_BY_LEN.get(len(date_str), _DATE_FORMATS_ALL):
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            pass
+    match = _YMD_RE.search(date_str)
+    if match:
+        try:
+            return datetime(int(match.group(1)), int(match.group(2)),
+                            int(match.group(3)))
+        except ValueError:
+            pass
+    return None
+
+
+# Common field names for dates and prices in API payloads
+_DATE_FIELDS = ('date', 'time', 'timestamp', 'x', 'datetime', 't')
+_PRICE_FIELDS = ('price', 'value', 'y', 'close', 'last', 'settlement')
+
+# Batch size above which pandas vectorized parsing beats per-item strptime
+_VECTORIZE_THRESHOLD = 50
+
+# Safety cap for walking pathological payloads
+_MAX_WALK_ITEMS = 100000
 
 
 class EUA2FuturesScraper:
@@ -21,115 +121,230 @@ class EUA2FuturesScraper:
     
     def __init__(self, output_file: str = "eua2_futures_data.csv"):
         self.output_file = output_file
+        self.parquet_file = str(Path(output_file).with_suffix('.parquet'))
         self.base_url = "https://www.ice.com/products/83048353/EUA-2-Futures/data"
+        self.api_url = "https://www.ice.com/marketdata/DelayedMarkets.shtml"
         self.market_id = "8322696"
-        self.data_points: List[Dict] = []
-        
-    def scrape_data(self, try_multiple_spans: bool = True) -> List[Dict]:
+        self.user_agent = ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+                           'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        # Canonical store is two parallel arrays (SoA): two small lists
+        # instead of a ~250-byte dict per record
+        self._dates: List[str] = []
+        self._prices: List[float] = []
+        # Once a span has yielded this many rows, remaining intercepted
+        # responses are skipped - enough history is already in hand
+        self.sufficient = 500
+        # Shared browser session, launched lazily and reused across
+        # scrape_data calls; close() shuts it down
+        self._pw = None
+        self._browser: Optional[Browser] = None
+
+    @property
+    def data_points(self) -> List[Dict]:
+        """Materialize the parallel arrays as dicts for API compatibility"""
+        return [{'date': date, 'price': price}
+                for date, price in zip(self._dates, self._prices)]
+
+    @data_points.setter
+    def data_points(self, records: List[Dict]):
+        self._dates = [r.get('date') for r in records]
+        self._prices = [r.get('price') for r in records]
+
+    async def _ensure_browser(self) -> Browser:
+        """Launch Chromium once and reuse it for subsequent scrapes"""
+        if self._browser is None or not self._browser.is_connected():
+            if self._pw is None:
+                self._pw = await async_playwright().start()
+            self._browser = await self._pw.chromium.launch(
+                headless=True,
+                args=[
+                    '--disable-gpu',
+                    '--disable-dev-shm-usage',
+                    '--blink-settings=imagesEnabled=false',
+                ]
+            )
+        return self._browser
+
+    async def close(self):
+        """Shut down the shared browser session (safe to call repeatedly)"""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._pw is not None:
+            try:
+                await self._pw.stop()
+            except Exception:
+                pass
+            self._pw = None
+
+    async def scrape_data_async(self, spans: Optional[List[int]] = None,
+                                use_conditional: bool = True) -> List[Dict]:
+        """
+        Fetch historical data for all spans concurrently via the ICE JSON API
+
+        Issues one aiohttp request per span and gathers them in parallel,
+        so total wall time is roughly the slowest request instead of the
+        sum. Falls back to an empty result (caller can use the Playwright
+        scrape) if aiohttp is unavailable or the API returns nothing.
+
+        Args:
+            spans: Span values to request (defaults to the same list as scrape_data)
+            use_conditional: Send If-None-Match/If-Modified-Since validators
+                             persisted from the previous run; a 304 reply
+                             reuses the cached body with no re-download
+
+        Returns:
+            List of dictionaries containing date and price data
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            print("⚠ aiohttp not installed, skipping concurrent API fetch")
+            return []
+
+        if spans is None:
+            spans = [3, 1, 2, 5, 10]
+
+        print(f"Fetching {len(spans)} spans concurrently from ICE API...")
+
+        all_data = []
+        # Keep the connection limit at the number of spans to avoid ICE throttling
+        connector = aiohttp.TCPConnector(limit=len(spans))
+        headers = {'User-Agent': self.user_agent}
+
+        cond_cache = self._load_conditional_cache() if use_conditional else {}
+
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            tasks = [self._fetch_span(session, span, cond_cache) for span in spans]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        if use_conditional:
+            self._save_conditional_cache(cond_cache)
+
+        for span, result in zip(spans, results):
+            if isinstance(result, Exception):
+                print(f"⚠ span={span} failed: {result}")
+            elif result:
+                print(f"✓ span={span}: {len(result)} data points")
+                all_data.extend(result)
+
+        # Remove duplicates
+        seen = set()
+        unique_data = []
+        for item in all_data:
+            key = (item.get('date'), item.get('price'))
+            if key not in seen:
+                seen.add(key)
+                unique_data.append(item)
+
+        if unique_data:
+            print(f"✓ Extracted {len(unique_data)} unique data points from API")
+            self.data_points = unique_data
+
+        return unique_data
+
+    async def _fetch_span(self, session, span: int,
+                          cond_cache: Optional[Dict] = None) -> List[Dict]:
+        """Fetch and parse historical chart data for a single span"""
+        params = {
+            'getHistoricalChartDataAsJson': '',
+            'marketId': self.market_id,
+            'historicalSpan': str(span),
+        }
+
+        key = f"span={span}"
+        entry = (cond_cache or {}).get(key, {})
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        async with session.get(self.api_url, params=params, timeout=30,
+                               headers=headers) as response:
+            # 304 Not Modified: server confirms the cached body is current
+            if response.status == 304 and entry.get('data') is not None:
+                print(f"  span={span}: not modified, using cached body")
+                return entry['data']
+            if response.status != 200:
+                return []
+            json_data = await response.json(content_type=None)
+            parsed = self._parse_json_data(json_data)
+            if cond_cache is not None:
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if etag or last_modified:
+                    cond_cache[key] = {
+                        'etag': etag,
+                        'last_modified': last_modified,
+                        'data': parsed,
+                    }
+            return parsed
+
+    def _load_conditional_cache(self) -> Dict:
+        """Load persisted ETag/Last-Modified validators and cached bodies"""
+        cache_file = Path('.scrape_cache') / 'conditional.json'
+        if not cache_file.exists():
+            return {}
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_conditional_cache(self, cond_cache: Dict):
+        """Persist conditional-GET validators for the next run"""
+        if not cond_cache:
+            return
+        try:
+            cache_dir = Path('.scrape_cache')
+            cache_dir.mkdir(exist_ok=True)
+            with open(cache_dir / 'conditional.json', 'w', encoding='utf-8') as f:
+                json.dump(cond_cache, f)
+        except Exception as e:
+            print(f"Warning: Could not save conditional-GET cache: {e}")
+
+    async def scrape_data(self, try_multiple_spans: bool = True) -> List[Dict]:
         """
         Scrape historical data from ICE website
-        
+
+        Spans are scraped concurrently, each in its own browser context,
+        with a semaphore capping simultaneous page loads. Wall time is
+        roughly the slowest span instead of the sum of all of them.
+
         Args:
             try_multiple_spans: Try different span values to get more historical data
-            
+
         Returns:
             List of dictionaries containing date and price data
         """
         print("Starting EUA 2 Futures data scraper...")
-        
+
         all_data = []
         spans_to_try = [3, 1, 2, 5, 10] if try_multiple_spans else [3]
-        
-        with sync_playwright() as p:
-            # Launch browser in headless mode
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = context.new_page()
-            
-            for span in spans_to_try:
-                print(f"\n--- Trying span={span} ---")
-                
-                # Collect network responses
-                api_responses = []
-                
-                def handle_response(response):
-                    url = response.url
-                    # Look for API endpoints that might contain price data
-                    if any(keyword in url.lower() for keyword in ['api', 'data', 'chart', 'price', 'market', 'historical', 'timeseries']):
-                        api_responses.append(response)
-                
-                page.on("response", handle_response)
-                
-                try:
-                    # Navigate to the page with different span values
-                    url = f"{self.base_url}?marketId={self.market_id}&span={span}"
-                    print(f"Navigating to: {url}")
-                    page.goto(url, wait_until="networkidle", timeout=60000)
-                    
-                    # Wait for the page to fully load and make API calls
-                    print("Waiting for page to load and API calls to complete...")
-                    time.sleep(8)
-                    
-                    # Try multiple strategies to extract data
-                    data = []
-                    
-                    # Strategy 1: Extract from intercepted API responses
-                    print("Strategy 1: Extracting from API responses...")
-                    for response in api_responses:
-                        try:
-                            if response.status == 200:
-                                content_type = response.headers.get('content-type', '')
-                                if 'json' in content_type:
-                                    json_data = response.json()
-                                    extracted = self._parse_json_data(json_data)
-                                    if extracted:
-                                        print(f"  Found {len(extracted)} data points from {response.url}")
-                                        data.extend(extracted)
-                        except Exception as e:
-                            continue
-                    
-                    # Strategy 2: Try to extract from page JavaScript/globals
-                    if not data:
-                        print("Strategy 2: Extracting from page JavaScript...")
-                        page_data = self._extract_from_javascript(page)
-                        if page_data:
-                            data.extend(page_data)
-                            print(f"  Found {len(page_data)} data points from JavaScript")
-                    
-                    # Strategy 3: Try to find data in page content/scripts
-                    if not data:
-                        print("Strategy 3: Extracting from page content...")
-                        content_data = self._extract_from_page_content(page)
-                        if content_data:
-                            data.extend(content_data)
-                            print(f"  Found {len(content_data)} data points from page content")
-                    
-                    # Strategy 4: Try to interact with chart elements
-                    if not data:
-                        print("Strategy 4: Attempting to extract from chart...")
-                        chart_data = self._extract_from_chart_interaction(page)
-                        if chart_data:
-                            data.extend(chart_data)
-                            print(f"  Found {len(chart_data)} data points from chart")
-                    
-                    if data:
-                        all_data.extend(data)
-                        print(f"✓ Extracted {len(data)} data points for span={span}")
-                    else:
-                        print(f"⚠ No data extracted for span={span}")
-                    
-                    # Remove response handler before next iteration
-                    page.remove_listener("response", handle_response)
-                    
-                except Exception as e:
-                    print(f"Error during scraping for span={span}: {e}")
-                    continue
-            
-            browser.close()
-        
+
+        # Parsed results keyed by (url, body digest), shared across spans
+        # so identical chart payloads decode and traverse only once
+        self._parse_cache: Dict[tuple, List[Dict]] = {}
+
+        # Reuse the shared browser; repeated scrapes in one process skip
+        # Chromium startup entirely
+        browser = await self._ensure_browser()
+        semaphore = asyncio.Semaphore(3)
+
+        tasks = [self._scrape_span(browser, span, semaphore)
+                 for span in spans_to_try]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for span, result in zip(spans_to_try, results):
+            if isinstance(result, Exception):
+                print(f"Error during scraping for span={span}: {result}")
+            elif result:
+                all_data.extend(result)
+
         if all_data:
             # Remove duplicates
             seen = set()
@@ -147,12 +362,145 @@ class EUA2FuturesScraper:
             print("\n⚠ Warning: No data extracted with any method.")
             print("  The website structure may have changed or require authentication.")
             return []
-    
-    
-    def _extract_from_javascript(self, page: Page) -> List[Dict]:
-        """Extract data from JavaScript variables and functions"""
+
+    async def _scrape_span(self, browser: Browser, span: int,
+                           semaphore: asyncio.Semaphore) -> List[Dict]:
+        """Scrape a single span in its own browser context"""
+        async with semaphore:
+            print(f"\n--- Trying span={span} ---")
+
+            context = await browser.new_context(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent=self.user_agent
+            )
+            page = await context.new_page()
+
+            # Abort resource types that can't affect JSON extraction -
+            # images, fonts, CSS and media are dead weight for this scrape
+            blocked_types = {'image', 'font', 'stylesheet', 'media'}
+
+            async def block_static_resources(route):
+                if route.request.resource_type in blocked_types:
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            await page.route("**/*", block_static_resources)
+
+            # Collect network responses
+            api_responses = []
+
+            def handle_response(response):
+                # Look for API endpoints that might contain price data
+                url_lower = response.url.lower()
+                if any(keyword in url_lower for keyword in _URL_KEYWORDS):
+                    api_responses.append(response)
+
+            page.on("response", handle_response)
+
+            try:
+                # Navigate to the page with different span values
+                url = f"{self.base_url}?marketId={self.market_id}&span={span}"
+                print(f"Navigating to: {url}")
+
+                def is_data_response(response):
+                    # The navigation URL itself contains 'data'/'market',
+                    # so require a JSON body to avoid resolving on the
+                    # main HTML document instead of the data XHR
+                    url_lower = response.url.lower()
+                    return (response.status == 200 and
+                            any(keyword in url_lower for keyword in _URL_KEYWORDS) and
+                            'json' in (response.headers.get('content-type') or ''))
+
+                # Wait for the data XHR itself instead of sleeping a fixed
+                # 8 seconds; the passive listener stays on as a fallback.
+                try:
+                    async with page.expect_response(is_data_response,
+                                                    timeout=30000) as response_info:
+                        await page.goto(url, wait_until="networkidle", timeout=60000)
+                    primary = await response_info.value
+                    if primary not in api_responses:
+                        api_responses.append(primary)
+                except Exception:
+                    # No matching response arrived in time; anything the
+                    # passive listener caught is still processed below
+                    pass
+
+                # Short grace period for straggler API calls
+                await asyncio.sleep(1)
+
+                # Try multiple strategies to extract data
+                data = []
+
+                # Strategy 1: Extract from intercepted API responses
+                print("Strategy 1: Extracting from API responses...")
+                for response in api_responses:
+                    if len(data) >= self.sufficient:
+                        # Enough rows already - don't re-deserialize the
+                        # remaining (often duplicate) payloads
+                        break
+                    try:
+                        if response.status == 200:
+                            content_type = response.headers.get('content-type', '')
+                            if 'json' in content_type:
+                                # ICE serves identical JSON several times per
+                                # page load; reuse the parsed result for
+                                # bodies we've seen already
+                                body = await response.body()
+                                digest = hashlib.blake2b(body, digest_size=16).digest()
+                                key = (response.url, digest)
+                                extracted = self._parse_cache.get(key)
+                                if extracted is None:
+                                    json_data = _json_loads(body)
+                                    extracted = self._parse_json_data(json_data)
+                                    self._parse_cache[key] = extracted
+                                if extracted:
+                                    print(f"  Found {len(extracted)} data points from {response.url}")
+                                    data.extend(extracted)
+                    except Exception:
+                        continue
+
+                # Strategies 2+3: page state and chart objects both just
+                # read the loaded page, so run them concurrently
+                if not data:
+                    print("Strategies 2+3: Extracting from page state and chart objects...")
+                    page_data, chart_data = await asyncio.gather(
+                        self._extract_from_page(page),
+                        self._extract_from_chart_objects(page))
+                    if page_data:
+                        data.extend(page_data)
+                        print(f"  Found {len(page_data)} data points from page")
+                    if chart_data:
+                        data.extend(chart_data)
+                        print(f"  Found {len(chart_data)} data points from chart objects")
+
+                # Strategy 4: hover sampling, only when everything else failed
+                if not data:
+                    print("Strategy 4: Attempting tooltip hover extraction...")
+                    hover_data = await self._extract_from_tooltip_hover(page)
+                    if hover_data:
+                        data.extend(hover_data)
+                        print(f"  Found {len(hover_data)} data points from tooltips")
+
+                if data:
+                    print(f"✓ Extracted {len(data)} data points for span={span}")
+                else:
+                    print(f"⚠ No data extracted for span={span}")
+
+                return data
+            finally:
+                await context.close()
+
+    async def _extract_from_page(self, page: Page) -> List[Dict]:
+        """
+        Extract data from JavaScript state and page content in one round-trip
+
+        Fuses the former JavaScript-globals probe and page-content scan into
+        a single page.evaluate, so each span pays one IPC crossing instead
+        of one per strategy plus a full page.content() serialization.
+        """
         data = []
-        
+
         try:
             # Try to execute JavaScript to find data
             js_code = """
@@ -211,97 +559,138 @@ class EUA2FuturesScraper:
                     } catch(e) {}
                 }
                 
-                return results;
+                return {
+                    jsResults: results,
+                    html: document.documentElement.outerHTML
+                };
             }
             """
-            
-            js_results = page.evaluate(js_code)
-            
-            for result in js_results:
-                extracted = self._parse_json_data(result.get('data'))
+
+            result = await page.evaluate(js_code)
+
+            for js_result in result.get('jsResults', []):
+                extracted = self._parse_json_data(js_result.get('data'))
                 if extracted:
                     data.extend(extracted)
-                    
+
+            # Fall back to regex-scanning the returned HTML for inline JSON;
+            # the matching happens here in Python, not in the page
+            if not data:
+                content = result.get('html', '')
+                for pattern in _SCRIPT_JSON_PATTERNS:
+                    for match in pattern.findall(content):
+                        try:
+                            extracted = self._parse_json_data(_json_loads(match))
+                            if extracted:
+                                data.extend(extracted)
+                        except Exception:
+                            continue
+
         except Exception as e:
-            print(f"Error extracting from JavaScript: {e}")
-        
+            print(f"Error extracting from page: {e}")
+
         return data
-    
-    def _extract_from_chart_interaction(self, page: Page) -> List[Dict]:
-        """Try to extract data by interacting with the chart"""
+
+    async def _extract_from_chart_objects(self, page: Page) -> List[Dict]:
+        """Extract series data directly from chart library objects"""
         data = []
-        
+
         try:
-            # Look for chart elements and try to get tooltip data
-            chart_selectors = [
-                'canvas',
-                '[class*="chart"]',
-                '[id*="chart"]',
-                '[class*="graph"]',
-                '[id*="graph"]',
-                'svg',
-            ]
-            
-            for selector in chart_selectors:
-                try:
-                    elements = page.query_selector_all(selector)
-                    if elements:
-                        # Try to hover over chart to trigger tooltip data
-                        for element in elements:
-                            try:
-                                # Hover over different points
-                                box = element.bounding_box()
-                                if box:
-                                    # Try hovering at different x positions
-                                    for x_offset in [0.1, 0.3, 0.5, 0.7, 0.9]:
-                                        page.mouse.move(box['x'] + box['width'] * x_offset, 
-                                                       box['y'] + box['height'] * 0.5)
-                                        time.sleep(0.1)
-                                        
-                                        # Try to find tooltip with data
-                                        tooltip = page.query_selector('[class*="tooltip"], [id*="tooltip"]')
-                                        if tooltip:
-                                            tooltip_text = tooltip.inner_text()
-                                            # Try to parse date and price from tooltip
-                                            parsed = self._parse_tooltip_text(tooltip_text)
-                                            if parsed:
-                                                data.append(parsed)
-                            except:
-                                continue
-                except:
-                    continue
-                    
+            # Chart libraries expose their series data directly on the chart
+            # object - read the xData/yData arrays in one evaluate instead of
+            # brute-force hovering every element at five offsets
+            series_data = await page.evaluate("""
+                () => {
+                    const charts = (window.Highcharts && window.Highcharts.charts) || [];
+                    const out = [];
+                    for (const chart of charts) {
+                        if (!chart || !chart.series) continue;
+                        for (const series of chart.series) {
+                            out.push({
+                                x: Array.from(series.xData || []),
+                                y: Array.from(series.yData || [])
+                            });
+                        }
+                    }
+                    return out;
+                }
+            """)
+
+            for series in series_data or []:
+                pairs = [list(pair) for pair in zip(series.get('x', []),
+                                                    series.get('y', []))]
+                if pairs:
+                    extracted = self._parse_json_data(pairs)
+                    if extracted:
+                        data.extend(extracted)
+
         except Exception as e:
-            print(f"Error extracting from chart interaction: {e}")
-        
+            print(f"Error extracting from chart objects: {e}")
+
+        return data
+
+    async def _extract_from_tooltip_hover(self, page: Page) -> List[Dict]:
+        """Last resort: hover the chart and parse tooltip text"""
+        data = []
+
+        try:
+            # Hover sampling is done entirely inside the page so all offsets
+            # and elements cost one CDP round-trip instead of a mouse.move +
+            # sleep + query per sample
+            tooltip_texts = await page.evaluate("""
+                async (offsets) => {
+                    const selectors = ['canvas', '[class*="chart"]', '[id*="chart"]',
+                                       '[class*="graph"]', '[id*="graph"]', 'svg'];
+                    const samples = [];
+                    const seen = new Set();
+                    for (const selector of selectors) {
+                        for (const el of document.querySelectorAll(selector)) {
+                            if (seen.has(el)) continue;
+                            seen.add(el);
+                            const box = el.getBoundingClientRect();
+                            if (!box.width || !box.height) continue;
+                            for (const offset of offsets) {
+                                el.dispatchEvent(new MouseEvent('mousemove', {
+                                    bubbles: true,
+                                    clientX: box.x + box.width * offset,
+                                    clientY: box.y + box.height * 0.5
+                                }));
+                                await new Promise(r => requestAnimationFrame(r));
+                                const tooltip = document.querySelector('[class*="tooltip"], [id*="tooltip"]');
+                                if (tooltip && tooltip.innerText) {
+                                    samples.push(tooltip.innerText);
+                                }
+                            }
+                        }
+                    }
+                    return samples;
+                }
+            """, [0.1, 0.3, 0.5, 0.7, 0.9])
+
+            for tooltip_text in tooltip_texts or []:
+                # Try to parse date and price from tooltip
+                parsed = self._parse_tooltip_text(tooltip_text)
+                if parsed:
+                    data.append(parsed)
+
+        except Exception as e:
+            print(f"Error extracting from tooltip hover: {e}")
+
         return data
     
     def _parse_tooltip_text(self, text: str) -> Optional[Dict]:
         """Parse tooltip text to extract date and price"""
-        import re
-        
         # Common patterns: "Date: 2023-01-01, Price: 85.50" or "2023-01-01: €85.50"
-        date_patterns = [
-            r'(\d{4}[-/]\d{2}[-/]\d{2})',
-            r'(\d{2}[-/]\d{2}[-/]\d{4})',
-        ]
-        
-        price_patterns = [
-            r'[\d,]+\.?\d*',
-            r'€\s*([\d,]+\.?\d*)',
-            r'\$\s*([\d,]+\.?\d*)',
-        ]
-        
         date_match = None
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
+        for pattern in _TOOLTIP_DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 date_match = match.group(1)
                 break
-        
+
         price_match = None
-        for pattern in price_patterns:
-            match = re.search(pattern, text)
+        for pattern in _TOOLTIP_PRICE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 price_match = match.group(1) if match.groups() else match.group(0)
                 break
@@ -311,146 +700,203 @@ class EUA2FuturesScraper:
                 # Normalize date
                 date_str = date_match.replace('/', '-')
                 # Normalize price (remove commas, currency symbols)
-                price = float(price_match.replace(',', ''))
+                price = float(price_match if ',' not in price_match
+                              else price_match.replace(',', ''))
                 return {'date': date_str, 'price': price}
-            except:
+            except ValueError:
                 pass
         
         return None
     
-    def _save_debug_info(self, page: Page):
-        """Save debug information for troubleshooting"""
+    async def _save_debug_info(self, page: Page):
+        """Save debug information for troubleshooting
+
+        Opt-in via the SCRAPER_DEBUG environment variable: dumping the
+        full HTML plus a screenshot costs hundreds of milliseconds per
+        span, so normal runs skip it entirely.
+        """
+        if not os.getenv('SCRAPER_DEBUG'):
+            return
         try:
             debug_dir = Path('debug')
             debug_dir.mkdir(exist_ok=True)
-            
-            # Save page HTML
-            html = page.content()
-            with open(debug_dir / 'page.html', 'w', encoding='utf-8') as f:
-                f.write(html)
-            
-            # Save page screenshot
-            page.screenshot(path=str(debug_dir / 'screenshot.png'))
-            
+
+            # Grab the page state in-loop, then push the disk writes off
+            # the event loop so they don't stall other spans
+            html = await page.content()
+            # Viewport-only JPEG is ~5x smaller than the default full PNG
+            screenshot = await page.screenshot(full_page=False,
+                                               type='jpeg', quality=60)
+
+            def _write():
+                (debug_dir / 'page.html').write_text(html, encoding='utf-8')
+                (debug_dir / 'screenshot.jpg').write_bytes(screenshot)
+
+            await asyncio.to_thread(_write)
             print(f"  Debug info saved to {debug_dir}/")
         except Exception as e:
             print(f"  Could not save debug info: {e}")
     
-    def _extract_from_page_content(self, page: Page) -> List[Dict]:
-        """Try to extract data from page content and scripts"""
-        data = []
-        
-        try:
-            # Get page content
-            content = page.content()
-            
-            # Look for JSON data in script tags
-            import re
-            json_patterns = [
-                r'var\s+\w+\s*=\s*(\{.*?\});',
-                r'data:\s*(\[.*?\])',
-                r'prices:\s*(\[.*?\])',
-                r'values:\s*(\[.*?\])',
-            ]
-            
-            for pattern in json_patterns:
-                matches = re.findall(pattern, content, re.DOTALL)
-                for match in matches:
-                    try:
-                        json_data = json.loads(match)
-                        extracted = self._parse_json_data(json_data)
-                        if extracted:
-                            data.extend(extracted)
-                    except:
-                        continue
-            
-            # Also check for data in window object
-            try:
-                page_data = page.evaluate("""
-                    () => {
-                        const data = [];
-                        // Try common variable names
-                        const vars = ['chartData', 'priceData', 'historicalData', 'data', 'series'];
-                        for (const varName of vars) {
-                            if (window[varName]) {
-                                data.push({name: varName, value: window[varName]});
-                            }
-                        }
-                        return data;
-                    }
-                """)
-                
-                for item in page_data:
-                    extracted = self._parse_json_data(item.get('value'))
-                    if extracted:
-                        data.extend(extracted)
-            except:
-                pass
-                
-        except Exception as e:
-            print(f"Error extracting from page content: {e}")
-        
-        return data
-    
-    
     def _parse_json_data(self, data: any) -> List[Dict]:
         """Parse JSON data to extract price and date information"""
         extracted = []
-        
+
         if not data:
             return extracted
-        
+
         try:
-            # Handle different data structures
-            if isinstance(data, list):
-                for item in data:
-                    parsed = self._parse_data_item(item)
-                    if parsed:
-                        extracted.append(parsed)
-            elif isinstance(data, dict):
-                # Check common keys
-                for key in ['data', 'series', 'values', 'prices', 'points', 'items']:
-                    if key in data:
-                        items = data[key]
-                        if isinstance(items, list):
-                            for item in items:
-                                parsed = self._parse_data_item(item)
-                                if parsed:
-                                    extracted.append(parsed)
-                
-                # Also try to parse the dict itself
-                parsed = self._parse_data_item(data)
+            # Fast path: ICE's chart payloads are almost always a flat
+            # [[ms_timestamp, price], ...] list. Detect that shape once and
+            # skip the generic walk and per-item field scan entirely.
+            if (isinstance(data, list)
+                    and isinstance(data[0], (list, tuple)) and len(data[0]) == 2
+                    and isinstance(data[0][0], (int, float))
+                    and isinstance(data[0][1], (int, float))):
+                return self._parse_timestamp_pairs(data)
+
+            # Iterative DFS over the payload with an explicit stack: finds
+            # record-shaped nodes at any nesting depth (the old version only
+            # probed a few hardcoded top-level keys) without recursion, and
+            # caps the walk on pathological payloads
+            pairs = []
+            stack = [data]
+            while stack and len(pairs) < _MAX_WALK_ITEMS:
+                node = stack.pop()
+                if isinstance(node, dict):
+                    pair = self._extract_raw_pair(node)
+                    if pair is not None:
+                        pairs.append(pair)
+                    stack.extend(value for value in node.values()
+                                 if isinstance(value, (dict, list)))
+                elif isinstance(node, list):
+                    for element in node:
+                        if isinstance(element, (dict, list)):
+                            pair = self._extract_raw_pair(element)
+                            if pair is not None:
+                                pairs.append(pair)
+                            else:
+                                stack.append(element)
+
+            # Large payloads go through pandas' C-level date/price parsing;
+            # small ones aren't worth the DataFrame overhead
+            if pd is not None and len(pairs) > _VECTORIZE_THRESHOLD:
+                try:
+                    return self._parse_pairs_vectorized(pairs)
+                except Exception:
+                    pass  # Fall back to the per-item parser
+
+            for date_value, price_value in pairs:
+                parsed = self._parse_data_item([date_value, price_value])
                 if parsed:
                     extracted.append(parsed)
-                    
+
         except Exception as e:
             print(f"Error parsing JSON data: {e}")
-        
+
         return extracted
-    
+
+    def _extract_raw_pair(self, item: any) -> Optional[tuple]:
+        """Pull raw (date, price) values from an item without parsing them"""
+        if isinstance(item, dict):
+            date_value = None
+            price_value = None
+            for field in _DATE_FIELDS:
+                if field in item:
+                    date_value = item[field]
+                    break
+            for field in _PRICE_FIELDS:
+                if field in item:
+                    price_value = item[field]
+                    break
+            # If it's a list-like structure [timestamp, value]
+            if date_value is None and price_value is None and len(item) == 2:
+                date_value, price_value = list(item.values())
+            if date_value and price_value:
+                return (date_value, price_value)
+        elif isinstance(item, list) and len(item) >= 2:
+            if item[0] and item[1]:
+                return (item[0], item[1])
+        return None
+
+    def _parse_timestamp_pairs(self, pairs: List) -> List[Dict]:
+        """Parse a flat [[unix_timestamp, price], ...] payload
+
+        Timestamps above 1e10 are treated as milliseconds. Uses pandas'
+        C-level conversion for large payloads; otherwise a tight loop over
+        fromtimestamp with no format sniffing. Epochs are always read as
+        UTC so results don't depend on the host timezone.
+        """
+        if pd is not None and len(pairs) > _VECTORIZE_THRESHOLD:
+            try:
+                ts = pd.Series([pair[0] for pair in pairs], dtype='float64')
+                ts = ts.where(ts < 1e10, ts / 1000)
+                prices = pd.to_numeric(
+                    pd.Series([pair[1] for pair in pairs]), errors='coerce')
+                parsed_dates = pd.to_datetime(ts, unit='s', errors='coerce')
+                mask = parsed_dates.notna() & prices.gt(0) & prices.lt(1000000)
+                return [{'date': d.strftime('%Y-%m-%d'), 'price': float(p)}
+                        for d, p in zip(parsed_dates[mask], prices[mask])]
+            except Exception:
+                pass  # Fall back to the plain loop
+
+        extracted = []
+        for pair in pairs:
+            # One ragged row (wrong arity, null price, bogus epoch) must
+            # not discard the rest of the payload
+            try:
+                timestamp, price = pair
+                if not 0 < price < 1000000:
+                    continue
+                if timestamp > 1e10:  # Milliseconds
+                    timestamp = timestamp / 1000
+                date_str = datetime.fromtimestamp(
+                    timestamp, tz=timezone.utc).strftime('%Y-%m-%d')
+            except (TypeError, ValueError, OverflowError, OSError):
+                continue
+            extracted.append({'date': date_str, 'price': float(price)})
+        return extracted
+
+    def _parse_pairs_vectorized(self, pairs: List[tuple]) -> List[Dict]:
+        """Batch-normalize raw (date, price) pairs instead of per-row strptime"""
+        if not pairs:
+            return []
+
+        raw_dates = [pair[0] for pair in pairs]
+        raw_prices = [pair[1] for pair in pairs]
+
+        dates = pd.Series(raw_dates)
+        if pd.api.types.is_numeric_dtype(dates):
+            # Unix timestamps, possibly in milliseconds
+            dates = dates.where(dates < 1e10, dates / 1000)
+            parsed_dates = pd.to_datetime(dates, unit='s', errors='coerce')
+        else:
+            parsed_dates = pd.to_datetime(dates.astype(str), errors='coerce',
+                                          format='mixed')
+        prices = pd.to_numeric(pd.Series(raw_prices), errors='coerce')
+
+        # Same validity window as _parse_data_item
+        mask = parsed_dates.notna() & prices.gt(0) & prices.lt(1000000)
+        return [{'date': d.strftime('%Y-%m-%d'), 'price': float(p)}
+                for d, p in zip(parsed_dates[mask], prices[mask])]
+
     def _parse_data_item(self, item: any) -> Optional[Dict]:
         """Parse a single data item to extract date and price"""
         if not isinstance(item, (dict, list)):
             return None
         
         try:
-            # Common field names for dates
-            date_fields = ['date', 'time', 'timestamp', 'x', 'datetime', 't']
-            # Common field names for prices
-            price_fields = ['price', 'value', 'y', 'close', 'last', 'settlement']
-            
             date_value = None
             price_value = None
-            
+
             if isinstance(item, dict):
                 # Try to find date
-                for field in date_fields:
+                for field in _DATE_FIELDS:
                     if field in item:
                         date_value = item[field]
                         break
-                
+
                 # Try to find price
-                for field in price_fields:
+                for field in _PRICE_FIELDS:
                     if field in item:
                         price_value = item[field]
                         break
@@ -474,35 +920,13 @@ class EUA2FuturesScraper:
                     # Might be Unix timestamp (in milliseconds or seconds)
                     if date_value > 1e10:
                         date_value = date_value / 1000
-                    date_obj = datetime.fromtimestamp(date_value)
+                    # UTC, matching _parse_timestamp_pairs - the same epoch
+                    # must yield the same date regardless of payload shape
+                    date_obj = datetime.fromtimestamp(date_value, tz=timezone.utc)
                 else:
                     # Try to parse date string
-                    date_str = str(date_value).strip()
-                    date_formats = [
-                        '%Y-%m-%d',
-                        '%a %b %d %H:%M:%S %Y',  # "Mon Jun 30 00:00:00 2025"
-                        '%Y-%m-%d %H:%M:%S',
-                        '%m/%d/%Y',
-                        '%d/%m/%Y',
-                    ]
-                    for fmt in date_formats:
-                        try:
-                            date_obj = datetime.strptime(date_str, fmt)
-                            break
-                        except:
-                            continue
-                    
-                    # If still not parsed, try regex
-                    if not date_obj:
-                        date_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', date_str)
-                        if date_match:
-                            try:
-                                date_obj = datetime(int(date_match.group(1)), 
-                                                   int(date_match.group(2)), 
-                                                   int(date_match.group(3)))
-                            except:
-                                pass
-                
+                    date_obj = _parse_date_str(str(date_value).strip())
+
                 if not date_obj:
                     return None
                 
@@ -515,7 +939,7 @@ class EUA2FuturesScraper:
                     # Skip invalid prices (market IDs, etc.)
                     if price <= 0 or price > 1000000:
                         return None
-                except:
+                except (TypeError, ValueError):
                     return None
                 
                 return {
@@ -538,26 +962,60 @@ class EUA2FuturesScraper:
         """
         existing_data = []
         output_path = Path(self.output_file)
-        
+
+        # Fast path: read the typed Parquet mirror if it is at least as new
+        # as the CSV - no per-row date parsing or validation needed.
+        parquet_data = self._load_parquet_mirror(output_path)
+        if parquet_data is not None:
+            return parquet_data
+
         if not output_path.exists():
             return existing_data
-        
+
         try:
-            with open(output_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with open(output_path, 'r', encoding='utf-8', newline='') as f:
+                # Positional csv.reader avoids the per-row dict that
+                # DictReader allocates
+                reader = csv.reader(f)
+                try:
+                    header = next(reader)
+                    i_date = header.index('date')
+                    i_price = header.index('price')
+                except (StopIteration, ValueError):
+                    return existing_data
+
+                n_cols = max(i_date, i_price) + 1
                 for row in reader:
-                    date_str = row.get('date', '').strip()
-                    price_str = row.get('price', '').strip()
-                    
+                    if len(row) < n_cols:
+                        continue
+                    date_str = row[i_date].strip()
+                    price_str = row[i_price].strip()
+
                     # Remove surrounding quotes if present
                     date_str = date_str.strip('"').strip("'")
                     price_str = price_str.strip('"').strip("'")
-                    
+
+                    # Fast path: well-formed ISO date and plain price - the
+                    # overwhelmingly common case after a clean save
+                    if _ISO_DATE_RE.match(date_str):
+                        try:
+                            price = float(price_str)
+                            if 0 < price <= 1000000:
+                                existing_data.append({'date': date_str, 'price': price})
+                            continue
+                        except ValueError:
+                            pass
+
                     # Check if the date column contains a list (malformed data)
-                    if date_str.startswith('[[') or date_str.startswith('['):
+                    if date_str.startswith('['):  # '[[' is covered by '['
                         # Try to parse the nested list structure
                         try:
-                            parsed_data = ast.literal_eval(date_str)
+                            # JSON-first: far faster than literal_eval and
+                            # usually works once quote style is swapped
+                            try:
+                                parsed_data = _json_loads(date_str.replace("'", '"'))
+                            except (TypeError, ValueError):
+                                parsed_data = ast.literal_eval(date_str)
                             if isinstance(parsed_data, list):
                                 for item in parsed_data:
                                     if isinstance(item, list) and len(item) >= 2:
@@ -565,75 +1023,108 @@ class EUA2FuturesScraper:
                                         price_val = float(item[1])
                                         # Parse date string to YYYY-MM-DD format
                                         try:
-                                            from datetime import datetime
                                             date_obj = datetime.strptime(date_val, '%a %b %d %H:%M:%S %Y')
                                             date_formatted = date_obj.strftime('%Y-%m-%d')
                                             existing_data.append({
                                                 'date': date_formatted,
                                                 'price': price_val
                                             })
-                                        except:
+                                        except ValueError:
                                             # If date parsing fails, try to use as-is
                                             existing_data.append({
                                                 'date': date_val,
                                                 'price': price_val
                                             })
-                        except:
+                        except (TypeError, ValueError, SyntaxError):
                             continue
                     else:
                         # Normal CSV format - skip if price looks like a market ID (very large number)
                         if date_str and price_str:
                             try:
-                                price = float(price_str.replace(',', ''))
+                                price = float(price_str if ',' not in price_str
+                                              else price_str.replace(',', ''))
                                 # Skip if price is suspiciously large (like a market ID) or invalid
                                 if price > 1000000 or price <= 0:
                                     continue
                                 # Validate date format (should be YYYY-MM-DD)
-                                if not re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
+                                if not _ISO_DATE_RE.match(date_str):
                                     # Try to parse and reformat
                                     try:
                                         date_obj = datetime.strptime(date_str, '%a %b %d %H:%M:%S %Y')
                                         date_str = date_obj.strftime('%Y-%m-%d')
-                                    except:
+                                    except ValueError:
                                         # Try other formats
                                         for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y']:
                                             try:
                                                 date_obj = datetime.strptime(date_str, fmt)
                                                 date_str = date_obj.strftime('%Y-%m-%d')
                                                 break
-                                            except:
+                                            except ValueError:
                                                 continue
                                 existing_data.append({
                                     'date': date_str,
                                     'price': price
                                 })
-                            except:
+                            except ValueError:
                                 continue
         except Exception as e:
             print(f"Warning: Could not load existing CSV: {e}")
-        
+
         return existing_data
-    
-    def cleanup_csv(self) -> int:
+
+    def _load_parquet_mirror(self, output_path: Path) -> Optional[List[Dict]]:
+        """
+        Load data from the Parquet mirror if it is usable
+
+        Returns None when pyarrow is missing, the mirror does not exist,
+        or the CSV has been modified more recently than the mirror.
+        """
+        if pq is None:
+            return None
+
+        parquet_path = Path(self.parquet_file)
+        if not parquet_path.exists():
+            return None
+        if output_path.exists() and output_path.stat().st_mtime > parquet_path.stat().st_mtime:
+            return None
+
+        try:
+            table = pq.read_table(parquet_path, columns=['date', 'price'])
+            return table.to_pylist()
+        except Exception as e:
+            print(f"Warning: Could not load Parquet mirror: {e}")
+            return None
+
+    def _write_parquet_mirror(self, data: List[Dict]):
+        """Write the Parquet mirror alongside the CSV (no-op without pyarrow)"""
+        if pa is None or not data:
+            return
+        try:
+            table = pa.Table.from_pylist(data)
+            pq.write_table(table, self.parquet_file, compression='zstd')
+        except Exception as e:
+            print(f"Warning: Could not write Parquet mirror: {e}")
+
+    def cleanup_csv(self) -> List[Dict]:
         """
         Clean up the CSV file by removing malformed rows and ensuring proper format
-        
+
         Returns:
-            Number of records after cleanup
+            The cleaned records, so callers can reuse them without re-reading the CSV
         """
         output_path = Path(self.output_file)
         if not output_path.exists():
-            return 0
-        
+            return []
+
         # Load all data (this will parse malformed rows)
         existing_data = self.load_existing_csv()
-        
+
         if not existing_data:
-            return 0
-        
+            return []
+
         # Save cleaned data back
         self.save_to_csv(existing_data, update_existing=False)
-        return len(existing_data)
+        return existing_data
     
     def save_to_csv(self, data: Optional[List[Dict]] = None, update_existing: bool = True) -> str:
         """
@@ -658,102 +1149,95 @@ class EUA2FuturesScraper:
         if update_existing and output_path.exists():
             existing_data = self.load_existing_csv()
             print(f"Found {len(existing_data)} existing data points in CSV")
-            
-            # Merge data: combine existing and new, then deduplicate
-            all_data = existing_data + data
-            
-            # Create a dictionary keyed by date to handle duplicates (keep latest price)
-            data_dict = {}
-            for item in all_data:
-                date = item.get('date')
-                if date:
-                    # If date already exists, keep the one with the newer data (prefer new over old)
-                    if date not in data_dict or date in [d.get('date') for d in data]:
-                        data_dict[date] = item
-            
-            # Convert back to list
-            merged_data = list(data_dict.values())
-            print(f"Merged with existing data: {len(merged_data)} total unique data points")
         else:
-            merged_data = data
-        
-        # Sort by date
-        merged_data = sorted(merged_data, key=lambda x: x.get('date', ''))
-        
-        # Remove duplicates based on date (final pass)
-        seen_dates = set()
-        unique_data = []
-        for item in merged_data:
-            date = item.get('date')
-            if date and date not in seen_dates:
-                seen_dates.add(date)
-                unique_data.append(item)
-        
+            existing_data = []
+
+        if pd is not None:
+            # Vectorized merge: concat existing + new, keep the newest value
+            # per date, sort - one C-level pass instead of Python dict loops
+            df = pd.concat([pd.DataFrame(existing_data), pd.DataFrame(data)],
+                           ignore_index=True)
+            df = df.drop_duplicates(subset='date', keep='last').sort_values('date')
+            unique_data = df.to_dict('records')
+            if existing_data:
+                print(f"Merged with existing data: {len(unique_data)} total unique data points")
+        else:
+            # Two-pass merge keyed by date: insert existing rows, then let
+            # dict.update overwrite with the new ones - "prefer new over
+            # old" in O(n+m) with no per-row membership tests
+            merged = {d['date']: d for d in existing_data if d.get('date')}
+            merged.update({d['date']: d for d in data if d.get('date')})
+
+            if existing_data:
+                print(f"Merged with existing data: {len(merged)} total unique data points")
+
+            # Sort by date; the dict already guarantees one row per date
+            unique_data = sorted(merged.values(), key=lambda x: x['date'])
+
         # Write to CSV - ensure clean format
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            if unique_data:
-                fieldnames = ['date', 'price']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                # Write clean, properly formatted rows
-                for item in unique_data:
-                    # Ensure date is in YYYY-MM-DD format
-                    date_str = item.get('date', '')
-                    date_obj = None
-                    
-                    # Handle different date formats
-                    if isinstance(date_str, datetime):
-                        date_obj = date_str
-                    elif isinstance(date_str, str):
-                        # Try to parse various date formats
-                        date_formats = [
-                            '%Y-%m-%d',
-                            '%a %b %d %H:%M:%S %Y',  # "Mon Jun 30 00:00:00 2025"
-                            '%Y-%m-%d %H:%M:%S',
-                            '%m/%d/%Y',
-                            '%d/%m/%Y',
-                        ]
-                        for fmt in date_formats:
-                            try:
-                                date_obj = datetime.strptime(date_str.strip(), fmt)
-                                break
-                            except:
-                                continue
-                        
-                        # If still not parsed, try regex
-                        if not date_obj:
-                            date_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', date_str)
-                            if date_match:
-                                try:
-                                    date_obj = datetime(int(date_match.group(1)), 
-                                                       int(date_match.group(2)), 
-                                                       int(date_match.group(3)))
-                                except:
-                                    pass
-                    else:
-                        continue
-                    
-                    if not date_obj:
+        written_rows = []
+        if pd is not None and unique_data:
+            # Normalize, validate and write in vectorized passes instead of
+            # re-parsing every row's date in Python
+            df = pd.DataFrame(unique_data)
+            df['date'] = pd.to_datetime(df['date'], errors='coerce',
+                                        format='mixed').dt.strftime('%Y-%m-%d')
+            df['price'] = pd.to_numeric(df['price'], errors='coerce')
+            df = df.dropna(subset=['date', 'price'])
+            # Skip market IDs and invalid prices
+            df = df[(df['price'] > 0) & (df['price'] < 1000000)]
+            df = df.drop_duplicates(subset='date').sort_values('date')
+            df = df[['date', 'price']]
+            # Round before writing so the Parquet mirror carries the same
+            # two-decimal values the CSV does
+            df['price'] = df['price'].round(2)
+            df.to_csv(output_path, index=False, float_format='%.2f')
+            written_rows = df.to_dict('records')
+        elif unique_data:
+            # Validate everything first, then hand the whole batch to
+            # writerows - one buffered write path instead of a Python/C
+            # crossing per record
+            rows = []
+            for item in unique_data:
+                # Ensure date is in YYYY-MM-DD format
+                date_str = item.get('date', '')
+                if isinstance(date_str, datetime):
+                    date_obj = date_str
+                elif isinstance(date_str, str):
+                    date_obj = _parse_date_str(date_str.strip())
+                else:
+                    continue
+
+                if not date_obj:
+                    continue
+
+                date_formatted = date_obj.strftime('%Y-%m-%d')
+
+                # Ensure price is a float
+                price = item.get('price', 0)
+                if not isinstance(price, (int, float)):
+                    try:
+                        price = float(price)
+                    except (TypeError, ValueError):
                         continue
-                    
-                    # Format date as YYYY-MM-DD
-                    date_formatted = date_obj.strftime('%Y-%m-%d')
-                    
-                    # Ensure price is a float
-                    price = item.get('price', 0)
-                    if not isinstance(price, (int, float)):
-                        try:
-                            price = float(price)
-                        except:
-                            continue
-                    
-                    # Only write valid data (skip market IDs and invalid prices)
-                    if date_formatted and price > 0 and price < 1000000:
-                        writer.writerow({
-                            'date': date_formatted,
-                            'price': f'{price:.2f}'
-                        })
-        
+
+                # Only keep valid data (skip market IDs and invalid prices)
+                if date_formatted and price > 0 and price < 1000000:
+                    # Round to match the CSV's two-decimal format so the
+                    # Parquet mirror and the CSV agree
+                    price = round(price, 2)
+                    rows.append((date_formatted, f'{price:.2f}'))
+                    written_rows.append({'date': date_formatted, 'price': price})
+
+            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['date', 'price'])
+                writer.writerows(rows)
+
+        # Keep the typed Parquet mirror in sync for fast reloads
+        self._write_parquet_mirror(written_rows)
+
+
         # Count new records (dates that are in the newly scraped data)
         new_dates = set(d.get('date') for d in data)
         new_count = len([d for d in unique_data if d.get('date') in new_dates])
@@ -770,9 +1254,15 @@ def main():
     """Main function to run the scraper"""
     scraper = EUA2FuturesScraper()
     
+    async def scrape_and_close():
+        try:
+            return await scraper.scrape_data()
+        finally:
+            await scraper.close()
+
     try:
         # Scrape the data
-        data = scraper.scrape_data()
+        data = asyncio.run(scrape_and_close())
         
         if data:
             # Save to CSV